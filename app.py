@@ -9,6 +9,13 @@ import pandas as pd
 import plotly.graph_objects as go
 from black_scholes import BlackScholes
 
+# Optional profiling support - open the app with ?profile=1 to get a
+# pyinstrument flame graph of the rerun appended to the page
+try:
+    from pyinstrument import Profiler
+except ImportError:
+    Profiler = None
+
 # Page configuration
 st.set_page_config(
     page_title="Black-Scholes Option Pricer",
@@ -16,6 +23,11 @@ st.set_page_config(
     layout="wide"
 )
 
+profiler = None
+if Profiler is not None and st.query_params.get("profile") == "1":
+    profiler = Profiler()
+    profiler.start()
+
 # Custom CSS for better styling
 st.markdown("""
     <style>
@@ -41,6 +53,161 @@ st.markdown("""
     </style>
 """, unsafe_allow_html=True)
 
+# Cached computations - reruns triggered by unrelated widgets (e.g. the P&L
+# toggle) hit the cache instead of recomputing the grids
+@st.cache_data
+def _linspace(a, b, n):
+    """Memoized np.linspace, shared by the heat-map and payoff sections"""
+    return np.linspace(a, b, n)
+
+
+@st.cache_resource
+def get_bs(S, K, T, r, sigma):
+    """Construct a BlackScholes instance, reused across reruns
+
+    The instance precomputes d1/d2 at construction and is never mutated,
+    so it is safe to share the cached object between reruns.
+    """
+    return BlackScholes(S, K, T, r, sigma)
+
+
+@st.cache_data
+def compute_heatmap(K, T, r, vol_min, vol_max, price_min, price_max, n=20):
+    """Compute call/put price grids for the heat maps"""
+    vol_range = _linspace(vol_min, vol_max, n)
+    price_range = _linspace(price_min, price_max, n)
+    call_grid, put_grid = BlackScholes.price_grid(price_range, K, T, r, vol_range)
+    # float32 is plenty of precision for a display-only heat map and halves
+    # the cached arrays and the payload serialized to the browser
+    return (vol_range.astype(np.float32), price_range.astype(np.float32),
+            call_grid.astype(np.float32), put_grid.astype(np.float32))
+
+
+@st.cache_data
+def compute_payoffs(S, K, n=100):
+    """Compute expiration payoff curves"""
+    stock_prices = _linspace(S * 0.5, S * 1.5, n)
+    # Clip in place so each curve costs one allocation instead of two
+    call_payoffs = np.subtract(stock_prices, K)
+    np.clip(call_payoffs, 0, None, out=call_payoffs)
+    put_payoffs = np.subtract(K, stock_prices)
+    np.clip(put_payoffs, 0, None, out=put_payoffs)
+    return stock_prices, call_payoffs, put_payoffs
+
+
+# Cached figure builders - Plotly figure construction and validation is a
+# measurable chunk of rerun time, so reuse figures when the data is unchanged.
+# ndarrays need an explicit hash_func since they are not hashable by default.
+@st.cache_data(hash_funcs={np.ndarray: lambda a: a.tobytes()})
+def build_heatmap_fig(z, x, y, colorscale, title):
+    """Build one heat-map figure from a display grid"""
+    # Note: go.Heatmapgl is not an option here - Streamlit's bundled
+    # plotly.js 3.x removed the heatmapgl trace type
+    fig = go.Figure(data=go.Heatmap(
+        z=z,
+        x=x,
+        y=y,
+        colorscale=colorscale,
+        hoverongaps=False,
+        hovertemplate='Stock Price: $%{x:.2f}<br>Volatility: %{y:.2f}<br>Value: $%{z:.2f}<extra></extra>'
+    ))
+
+    fig.update_layout(
+        title=title,
+        xaxis_title='Stock Price ($)',
+        yaxis_title='Volatility (σ)',
+        height=500
+    )
+
+    return fig
+
+
+@st.cache_data(hash_funcs={np.ndarray: lambda a: a.tobytes()})
+def build_payoff_fig(x, y, name, color, strike_color, K, title, yaxis_title):
+    """Build one payoff-diagram figure from a payoff or P&L curve"""
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=x,
+        y=y,
+        mode='lines',
+        name=name,
+        line=dict(color=color, width=3)
+    ))
+    fig.add_hline(y=0, line_dash="dash", line_color="gray")
+    fig.add_vline(x=K, line_dash="dash", line_color=strike_color,
+                  annotation_text=f"Strike: ${K}")
+
+    fig.update_layout(
+        title=title,
+        xaxis_title='Stock Price at Expiration ($)',
+        yaxis_title=yaxis_title,
+        height=400
+    )
+
+    return fig
+
+
+# Rendering fragments - reruns triggered inside these sections stay scoped
+# to the fragment instead of re-executing the whole script
+@st.fragment
+def render_heatmaps(vol_range, price_range, call_display, put_display, enable_pnl):
+    """Render the call/put heat map tabs from precomputed display grids"""
+    if enable_pnl:
+        colorscale = 'RdYlGn'  # Red for losses, green for profits
+        title_suffix = " (P&L)"
+    else:
+        colorscale = 'Blues'
+        title_suffix = ""
+
+    tab1, tab2 = st.tabs(["📞 Call Option", "📉 Put Option"])
+
+    with tab1:
+        fig_call = build_heatmap_fig(
+            call_display, price_range, vol_range, colorscale,
+            f'Call Option Values{title_suffix} vs Stock Price & Volatility'
+        )
+        st.plotly_chart(fig_call, use_container_width=True)
+
+    with tab2:
+        fig_put = build_heatmap_fig(
+            put_display, price_range, vol_range, colorscale,
+            f'Put Option Values{title_suffix} vs Stock Price & Volatility'
+        )
+        st.plotly_chart(fig_put, use_container_width=True)
+
+
+@st.fragment
+def render_payoffs(stock_prices_payoff, call_payoffs, put_payoffs, K,
+                   enable_pnl, purchase_price_call, purchase_price_put):
+    """Render the call/put payoff diagram tabs from precomputed curves"""
+    if enable_pnl:
+        call_pnl = call_payoffs - purchase_price_call
+        put_pnl = put_payoffs - purchase_price_put
+
+    payoff_tab1, payoff_tab2 = st.tabs(["📞 Call Payoff", "📉 Put Payoff"])
+
+    mode_label = 'P&L' if enable_pnl else 'Payoff'
+    yaxis_title = 'P&L ($)' if enable_pnl else 'Payoff ($)'
+
+    with payoff_tab1:
+        fig_call_payoff = build_payoff_fig(
+            stock_prices_payoff,
+            call_payoffs if not enable_pnl else call_pnl,
+            f'Call {mode_label}', 'green', 'red', K,
+            f'Call Option {mode_label} at Expiration', yaxis_title
+        )
+        st.plotly_chart(fig_call_payoff, use_container_width=True)
+
+    with payoff_tab2:
+        fig_put_payoff = build_payoff_fig(
+            stock_prices_payoff,
+            put_payoffs if not enable_pnl else put_pnl,
+            f'Put {mode_label}', 'red', 'blue', K,
+            f'Put Option {mode_label} at Expiration', yaxis_title
+        )
+        st.plotly_chart(fig_put_payoff, use_container_width=True)
+
+
 # Title
 st.markdown('<p class="main-header">📈 Black-Scholes Option Pricer</p>', unsafe_allow_html=True)
 st.markdown('<p style="text-align: center; color: #666;">Built by Patricio Putz</p>', unsafe_allow_html=True)
@@ -158,8 +325,8 @@ price_max = st.sidebar.number_input(
 )
 
     
-# Create Black-Scholes object
-bs = BlackScholes(S, K, T, r, sigma)
+# Create Black-Scholes object (cached across reruns on the five inputs)
+bs = get_bs(S, K, T, r, sigma)
 
 # Calculate prices
 call_price = bs.call_price()
@@ -219,129 +386,32 @@ st.subheader("🔥 Sensitivity Analysis - Heat Maps")
 
 st.info(f"📊 Analyzing {vol_max - vol_min:.2f} volatility range and ${price_max - price_min:.0f} price range")
 
-# Generate heat map data
-vol_range = np.linspace(vol_min, vol_max, 20)
-price_range = np.linspace(price_min, price_max, 20)
-
-call_values = np.zeros((len(vol_range), len(price_range)))
-put_values = np.zeros((len(vol_range), len(price_range)))
-
-for i, vol in enumerate(vol_range):
-    for j, price in enumerate(price_range):
-        bs_temp = BlackScholes(price, K, T, r, vol)
-        call_values[i, j] = bs_temp.call_price()
-        put_values[i, j] = bs_temp.put_price()
+# Generate heat map data (cached - P&L subtraction happens outside so
+# toggling P&L does not invalidate the cache)
+vol_range, price_range, call_values, put_values = compute_heatmap(
+    K, T, r, vol_min, vol_max, price_min, price_max
+)
 
-# If P&L tracking is enabled, show P&L instead of raw values
+# If P&L tracking is enabled, show P&L instead of raw values. cache_data
+# hands back fresh copies each rerun, so shifting in place costs no extra
+# grid allocation
 if enable_pnl:
-    call_display = call_values - purchase_price_call
-    put_display = put_values - purchase_price_put
-    colorscale = 'RdYlGn'  # Red for losses, green for profits
-    title_suffix = " (P&L)"
-else:
-    call_display = call_values
-    put_display = put_values
-    colorscale = 'Blues'
-    title_suffix = ""
-
-# Create heat maps
-tab1, tab2 = st.tabs(["📞 Call Option", "📉 Put Option"])
-
-with tab1:
-    fig_call = go.Figure(data=go.Heatmap(
-        z=call_display,
-        x=price_range,
-        y=vol_range,
-        colorscale=colorscale,
-        hoverongaps=False,
-        hovertemplate='Stock Price: $%{x:.2f}<br>Volatility: %{y:.2f}<br>Value: $%{z:.2f}<extra></extra>'
-    ))
-    
-    fig_call.update_layout(
-        title=f'Call Option Values{title_suffix} vs Stock Price & Volatility',
-        xaxis_title='Stock Price ($)',
-        yaxis_title='Volatility (σ)',
-        height=500
-    )
-    
-    st.plotly_chart(fig_call, use_container_width=True)
+    call_values -= purchase_price_call
+    put_values -= purchase_price_put
 
-with tab2:
-    fig_put = go.Figure(data=go.Heatmap(
-        z=put_display,
-        x=price_range,
-        y=vol_range,
-        colorscale=colorscale,
-        hoverongaps=False,
-        hovertemplate='Stock Price: $%{x:.2f}<br>Volatility: %{y:.2f}<br>Value: $%{z:.2f}<extra></extra>'
-    ))
-    
-    fig_put.update_layout(
-        title=f'Put Option Values{title_suffix} vs Stock Price & Volatility',
-        xaxis_title='Stock Price ($)',
-        yaxis_title='Volatility (σ)',
-        height=500
-    )
-    
-    st.plotly_chart(fig_put, use_container_width=True)
+render_heatmaps(vol_range, price_range, call_values, put_values, enable_pnl)
 
 # Payoff diagrams
 st.subheader("📈 Payoff Diagrams at Expiration")
 
-# Generate payoff data
-stock_prices_payoff = np.linspace(S * 0.5, S * 1.5, 100)
-call_payoffs = np.maximum(stock_prices_payoff - K, 0)
-put_payoffs = np.maximum(K - stock_prices_payoff, 0)
+# Generate payoff data (cached)
+stock_prices_payoff, call_payoffs, put_payoffs = compute_payoffs(S, K)
 
-if enable_pnl:
-    call_pnl = call_payoffs - purchase_price_call
-    put_pnl = put_payoffs - purchase_price_put
-
-payoff_tab1, payoff_tab2 = st.tabs(["📞 Call Payoff", "📉 Put Payoff"])
-
-with payoff_tab1:
-    fig_call_payoff = go.Figure()
-    fig_call_payoff.add_trace(go.Scatter(
-        x=stock_prices_payoff,
-        y=call_payoffs if not enable_pnl else call_pnl,
-        mode='lines',
-        name='Call ' + ('P&L' if enable_pnl else 'Payoff'),
-        line=dict(color='green', width=3)
-    ))
-    fig_call_payoff.add_hline(y=0, line_dash="dash", line_color="gray")
-    fig_call_payoff.add_vline(x=K, line_dash="dash", line_color="red", 
-                                annotation_text=f"Strike: ${K}")
-    
-    fig_call_payoff.update_layout(
-        title='Call Option ' + ('P&L' if enable_pnl else 'Payoff') + ' at Expiration',
-        xaxis_title='Stock Price at Expiration ($)',
-        yaxis_title='P&L ($)' if enable_pnl else 'Payoff ($)',
-        height=400
-    )
-    
-    st.plotly_chart(fig_call_payoff, use_container_width=True)
-
-with payoff_tab2:
-    fig_put_payoff = go.Figure()
-    fig_put_payoff.add_trace(go.Scatter(
-        x=stock_prices_payoff,
-        y=put_payoffs if not enable_pnl else put_pnl,
-        mode='lines',
-        name='Put ' + ('P&L' if enable_pnl else 'Payoff'),
-        line=dict(color='red', width=3)
-    ))
-    fig_put_payoff.add_hline(y=0, line_dash="dash", line_color="gray")
-    fig_put_payoff.add_vline(x=K, line_dash="dash", line_color="blue",
-                                annotation_text=f"Strike: ${K}")
-    
-    fig_put_payoff.update_layout(
-        title='Put Option ' + ('P&L' if enable_pnl else 'Payoff') + ' at Expiration',
-        xaxis_title='Stock Price at Expiration ($)',
-        yaxis_title='P&L ($)' if enable_pnl else 'Payoff ($)',
-        height=400
-    )
-    
-    st.plotly_chart(fig_put_payoff, use_container_width=True)
+render_payoffs(
+    stock_prices_payoff, call_payoffs, put_payoffs, K, enable_pnl,
+    purchase_price_call if enable_pnl else 0.0,
+    purchase_price_put if enable_pnl else 0.0
+)
 
 # Footer
 st.markdown("---")
@@ -354,3 +424,7 @@ st.markdown("""
         <p><em>For educational purposes only. Not financial advice.</em></p>
     </div>
 """, unsafe_allow_html=True)
+
+if profiler is not None:
+    profiler.stop()
+    st.components.v1.html(profiler.output_html(), height=800, scrolling=True)
@@ -3,8 +3,51 @@ Black-Scholes Option Pricing Model
 Calculates European call and put option prices
 """
 
+import math
+
 import numpy as np
-from scipy.stats import norm
+from scipy.special import ndtr
+
+_INV_SQRT2 = 1 / math.sqrt(2)
+_INV_SQRT_2PI = 1 / math.sqrt(2 * math.pi)
+
+
+def _ncdf(x):
+    """Standard normal CDF for scalars, avoiding scipy's per-call dispatch overhead"""
+    return 0.5 * (1.0 + math.erf(x * _INV_SQRT2))
+
+
+def _npdf(x):
+    """Standard normal PDF for scalars"""
+    return _INV_SQRT_2PI * math.exp(-0.5 * x * x)
+
+
+# Optional Numba-compiled grid kernel: fuses the whole grid computation into
+# one parallel loop with no intermediate arrays. Used by price_grid when
+# numba is installed; the broadcast NumPy path is the fallback.
+try:
+    from numba import njit, prange
+except ImportError:
+    _bs_grid = None
+else:
+    # Explicit signature: compile at import rather than on first call, so the
+    # result lands in the on-disk cache and later cold starts skip LLVM entirely
+    @njit('void(f8[:], f8, f8, f8, f8[:], f8[:, :], f8[:, :])',
+          cache=True, fastmath=True, parallel=True)
+    def _bs_grid(S, K, T, r, sig, out_call, out_put):
+        sqrt_T = math.sqrt(T)
+        discount = math.exp(-r * T)
+        for i in prange(sig.shape[0]):
+            s = sig[i]
+            sig_sqrt_T = s * sqrt_T
+            drift = (r + 0.5 * s * s) * T
+            for j in range(S.shape[0]):
+                d1 = (math.log(S[j] / K) + drift) / sig_sqrt_T
+                d2 = d1 - sig_sqrt_T
+                cdf_d1 = 0.5 * (1.0 + math.erf(d1 * _INV_SQRT2))
+                cdf_d2 = 0.5 * (1.0 + math.erf(d2 * _INV_SQRT2))
+                out_call[i, j] = S[j] * cdf_d1 - K * discount * cdf_d2
+                out_put[i, j] = K * discount * (1 - cdf_d2) - S[j] * (1 - cdf_d1)
 
 
 class BlackScholes:
@@ -12,10 +55,17 @@ class BlackScholes:
     Black-Scholes option pricing model for European options
     """
     
+    def __new__(cls, S, K, T, r, sigma):
+        # Specialize at construction: the T <= 0 case gets its own class so
+        # the live pricing methods carry no expiry branches at all
+        if cls is BlackScholes:
+            cls = _BlackScholesLive if T > 0 else _BlackScholesAtExpiry
+        return object.__new__(cls)
+
     def __init__(self, S, K, T, r, sigma):
         """
         Initialize Black-Scholes parameters
-        
+
         Parameters:
         -----------
         S : float
@@ -34,104 +84,226 @@ class BlackScholes:
         self.T = T
         self.r = r
         self.sigma = sigma
-        
+
+    @classmethod
+    def price_grid(cls, S_arr, K, T, r, sigma_arr):
+        """
+        Calculate call and put prices over a grid of stock prices and volatilities
+
+        Broadcasts the Black-Scholes formula so the whole grid is computed in a
+        handful of array operations instead of one object per cell.
+
+        Parameters:
+        -----------
+        S_arr : ndarray
+            1D array of stock prices (grid columns)
+        K : float
+            Strike price
+        T : float
+            Time to maturity (in years)
+        r : float
+            Risk-free interest rate
+        sigma_arr : ndarray
+            1D array of volatilities (grid rows)
+
+        Returns:
+        --------
+        tuple of ndarray : (call_grid, put_grid), each of shape (len(sigma_arr), len(S_arr))
+        """
+        if _bs_grid is not None:
+            S_flat = np.ascontiguousarray(S_arr, dtype=np.float64)
+            sigma_flat = np.ascontiguousarray(sigma_arr, dtype=np.float64)
+            call_grid = np.empty((sigma_flat.shape[0], S_flat.shape[0]))
+            put_grid = np.empty_like(call_grid)
+            _bs_grid(S_flat, K, T, r, sigma_flat, call_grid, put_grid)
+            return call_grid, put_grid
+
+        S = np.asarray(S_arr, dtype=float)[None, :]
+        sigma = np.asarray(sigma_arr, dtype=float)[:, None]
+
+        sqrt_T = np.sqrt(T)
+        discount = np.exp(-r * T)
+
+        d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * sqrt_T)
+        d2 = d1 - sigma * sqrt_T
+
+        cdf_d1 = ndtr(d1)
+        cdf_d2 = ndtr(d2)
+
+        call_grid = S * cdf_d1 - K * discount * cdf_d2
+        put_grid = K * discount * (1 - cdf_d2) - S * (1 - cdf_d1)
+        return call_grid, put_grid
+
+
+class _BlackScholesLive(BlackScholes):
+    """Pricing for T > 0: precomputed d1/d2 terms, no expiry branches"""
+
+    def __init__(self, S, K, T, r, sigma):
+        super().__init__(S, K, T, r, sigma)
+
+        # Precompute everything the prices and greeks share, so each method
+        # is a couple of multiplications instead of fresh transcendental calls
+        self._sqrt_T = math.sqrt(T)
+        self._exp_mrT = math.exp(-r * T)
+        self._d1_val = (math.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * self._sqrt_T)
+        self._d2_val = self._d1_val - sigma * self._sqrt_T
+        self._pdf_d1 = _npdf(self._d1_val)
+        self._cdf_d1 = _ncdf(self._d1_val)
+        self._cdf_d2 = _ncdf(self._d2_val)
+
     def _d1(self):
         """Calculate d1 parameter in Black-Scholes formula"""
-        return (np.log(self.S / self.K) + (self.r + 0.5 * self.sigma**2) * self.T) / (self.sigma * np.sqrt(self.T))
-    
+        return self._d1_val
+
     def _d2(self):
         """Calculate d2 parameter in Black-Scholes formula"""
-        return self._d1() - self.sigma * np.sqrt(self.T)
-    
+        return self._d2_val
+
     def call_price(self):
         """
         Calculate European call option price
-        
+
         Returns:
         --------
         float : Call option price
         """
-        if self.T <= 0:
-            return max(0, self.S - self.K)
-        
-        d1 = self._d1()
-        d2 = self._d2()
-        
-        call = self.S * norm.cdf(d1) - self.K * np.exp(-self.r * self.T) * norm.cdf(d2)
-        return call
-    
+        return self.S * self._cdf_d1 - self.K * self._exp_mrT * self._cdf_d2
+
     def put_price(self):
         """
         Calculate European put option price
-        
+
         Returns:
         --------
         float : Put option price
         """
-        if self.T <= 0:
-            return max(0, self.K - self.S)
-        
-        d1 = self._d1()
-        d2 = self._d2()
-        
-        put = self.K * np.exp(-self.r * self.T) * norm.cdf(-d2) - self.S * norm.cdf(-d1)
-        return put
-    
+        return self.K * self._exp_mrT * (1 - self._cdf_d2) - self.S * (1 - self._cdf_d1)
+
     def delta_call(self):
         """Calculate call option delta (rate of change with respect to stock price)"""
-        if self.T <= 0:
-            return 1.0 if self.S > self.K else 0.0
-        return norm.cdf(self._d1())
-    
+        return self._cdf_d1
+
     def delta_put(self):
         """Calculate put option delta"""
-        if self.T <= 0:
-            return -1.0 if self.S < self.K else 0.0
-        return norm.cdf(self._d1()) - 1
-    
+        return self._cdf_d1 - 1
+
     def gamma(self):
         """Calculate gamma (rate of change of delta)"""
-        if self.T <= 0:
-            return 0.0
-        return norm.pdf(self._d1()) / (self.S * self.sigma * np.sqrt(self.T))
-    
+        return self._pdf_d1 / (self.S * self.sigma * self._sqrt_T)
+
     def vega(self):
         """Calculate vega (sensitivity to volatility)"""
-        if self.T <= 0:
-            return 0.0
-        return self.S * norm.pdf(self._d1()) * np.sqrt(self.T)
-    
+        return self.S * self._pdf_d1 * self._sqrt_T
+
     def theta_call(self):
         """Calculate call option theta (time decay)"""
-        if self.T <= 0:
-            return 0.0
-        d1 = self._d1()
-        d2 = self._d2()
-        theta = (-self.S * norm.pdf(d1) * self.sigma / (2 * np.sqrt(self.T)) 
-                 - self.r * self.K * np.exp(-self.r * self.T) * norm.cdf(d2))
+        theta = (-self.S * self._pdf_d1 * self.sigma / (2 * self._sqrt_T)
+                 - self.r * self.K * self._exp_mrT * self._cdf_d2)
         return theta / 365  # Convert to daily theta
-    
+
     def theta_put(self):
         """Calculate put option theta (time decay)"""
-        if self.T <= 0:
-            return 0.0
-        d1 = self._d1()
-        d2 = self._d2()
-        theta = (-self.S * norm.pdf(d1) * self.sigma / (2 * np.sqrt(self.T)) 
-                 + self.r * self.K * np.exp(-self.r * self.T) * norm.cdf(-d2))
+        theta = (-self.S * self._pdf_d1 * self.sigma / (2 * self._sqrt_T)
+                 + self.r * self.K * self._exp_mrT * (1 - self._cdf_d2))
         return theta / 365  # Convert to daily theta
-    
+
     def rho_call(self):
         """Calculate call option rho (sensitivity to interest rate)"""
-        if self.T <= 0:
-            return 0.0
-        return self.K * self.T * np.exp(-self.r * self.T) * norm.cdf(self._d2())
-    
+        return self.K * self.T * self._exp_mrT * self._cdf_d2
+
     def rho_put(self):
         """Calculate put option rho (sensitivity to interest rate)"""
-        if self.T <= 0:
-            return 0.0
-        return -self.K * self.T * np.exp(-self.r * self.T) * norm.cdf(-self._d2())
+        return -self.K * self.T * self._exp_mrT * (1 - self._cdf_d2)
+
+
+class _BlackScholesAtExpiry(BlackScholes):
+    """Pricing at T <= 0: prices collapse to intrinsic value, greeks to zero"""
+
+    def call_price(self):
+        """Calculate call option value at expiration (intrinsic value)"""
+        return max(0, self.S - self.K)
+
+    def put_price(self):
+        """Calculate put option value at expiration (intrinsic value)"""
+        return max(0, self.K - self.S)
+
+    def delta_call(self):
+        """Calculate call option delta at expiration"""
+        return 1.0 if self.S > self.K else 0.0
+
+    def delta_put(self):
+        """Calculate put option delta at expiration"""
+        return -1.0 if self.S < self.K else 0.0
+
+    def gamma(self):
+        """Gamma is zero at expiration"""
+        return 0.0
+
+    def vega(self):
+        """Vega is zero at expiration"""
+        return 0.0
+
+    def theta_call(self):
+        """Theta is zero at expiration"""
+        return 0.0
+
+    def theta_put(self):
+        """Theta is zero at expiration"""
+        return 0.0
+
+    def rho_call(self):
+        """Rho is zero at expiration"""
+        return 0.0
+
+    def rho_put(self):
+        """Rho is zero at expiration"""
+        return 0.0
+
+
+def bs_call_put(S, K, T, r, sigma, sqrt_T=None, discount=None):
+    """
+    Calculate European call and put prices without constructing a BlackScholes object
+
+    Computes d1/d2 once and prices both legs, so hot loops that need scalar
+    evaluation avoid per-cell object creation and method dispatch.
+
+    Parameters:
+    -----------
+    S : float
+        Current stock price
+    K : float
+        Strike price
+    T : float
+        Time to maturity (in years)
+    r : float
+        Risk-free interest rate
+    sigma : float
+        Volatility
+    sqrt_T : float, optional
+        Precomputed sqrt(T); loops over many S/sigma at fixed T, r should
+        hoist this out and pass it in
+    discount : float, optional
+        Precomputed exp(-r * T), same idea as sqrt_T
+
+    Returns:
+    --------
+    tuple of float : (call_price, put_price)
+    """
+    if T <= 0:
+        return max(0, S - K), max(0, K - S)
+
+    if sqrt_T is None:
+        sqrt_T = math.sqrt(T)
+    if discount is None:
+        discount = math.exp(-r * T)
+    d1 = (math.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * sqrt_T)
+    d2 = d1 - sigma * sqrt_T
+    cdf_d1 = _ncdf(d1)
+    cdf_d2 = _ncdf(d2)
+
+    call = S * cdf_d1 - K * discount * cdf_d2
+    put = K * discount * (1 - cdf_d2) - S * (1 - cdf_d1)
+    return call, put
 
 
 def calculate_option_price(S, K, T, r, sigma, option_type='call'):